@@ -4,11 +4,18 @@ Enables decentralized explainable AI via Internet Computer Protocol
 """
 
 import os
+import copy
 import json
-import aiohttp
+import time
+import random
+import asyncio
+import httpx
 import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import functools
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from src.core.shared.config.ziggurat_config import (
@@ -25,8 +32,145 @@ from .models import (
     AIModelInfo
 )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by all requests made through one client, so
+# sequential calls reuse connections instead of redoing TCP/TLS handshakes
+CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0
+)
+
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj: Any) -> bytes:
+        # Non-str keys are stringified as json.dumps does; anything else
+        # orjson rejects (e.g. ints over 64 bits) goes through the stdlib
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return json.dumps(obj).encode()
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
+# Mock proof hashes only need to look like digests, so use the faster
+# SIMD BLAKE3 when installed (same 64 hex character length as SHA-256)
+if BLAKE3_AVAILABLE:
+    def _mock_hash(data: bytes) -> str:
+        return blake3(data).hexdigest()
+else:
+    def _mock_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+# Transient explain failures (connection errors, timeouts, 5xx) are retried
+# up to EXPLAIN_MAX_RETRIES times with full-jitter exponential backoff
+# before falling back to a mock explanation
+EXPLAIN_MAX_RETRIES = 2
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 2.0
+
+# Copying a prebuilt dict shares its key table, which is cheaper than
+# building the explain payload from a literal on every call
+_EXPLAIN_PAYLOAD_TEMPLATE = dict.fromkeys(("data", "method", "model_id", "request_id", "timestamp"))
+
+# Response fields copied straight into parsed objects, with the defaults
+# used when the satellite omits them. Container fields other than
+# feature_importance fall back to the model's own defaults.
+_EXPLANATION_DEFAULTS = {
+    "reasoning": "",
+    "confidence": 0.0,
+    "blockchain_verified": False,
+    "proof_hash": None,
+    "transaction_id": None,
+    "processing_time_ms": 0,
+    "cost_cycles": 0,
+    "model_id": None
+}
+_EXPLANATION_FIELDS = frozenset(_EXPLANATION_DEFAULTS).union(
+    ("feature_importance", "decision_path", "counterfactuals", "cross_chain_proofs")
+)
+
+_MODEL_INFO_DEFAULTS = {
+    "model_id": "",
+    "name": "",
+    "description": "",
+    "model_type": "",
+    "max_input_size": 0,
+    "output_format": "json",
+    "cost_per_inference": 1000000,
+    "gpu_enabled": False,
+    "memory_requirements_gb": 0.0
+}
+_MODEL_INFO_FIELDS = frozenset(_MODEL_INFO_DEFAULTS).union(("canister_id",))
+
+# explain() calls arriving within EXPLAIN_BATCH_MAX_WAIT seconds of each
+# other are coalesced into one /explain_batch request of up to
+# EXPLAIN_BATCH_MAX_SIZE explanations
+EXPLAIN_BATCH_MAX_SIZE = 32
+EXPLAIN_BATCH_MAX_WAIT = 0.005
+
+# Entries kept in each per-client LRU result cache
+RESULT_CACHE_SIZE = 4096
+
+# Seconds a fetched model catalog is reused before /models is queried again
+MODELS_CACHE_TTL = 60.0
+
+# HTTP clients shared by connected ICPOpenXAIClient instances, keyed by
+# (satellite_url, satellite_id, event loop) so short-lived instances reuse
+# one warm connection pool, but never one bound to another (or a closed)
+# loop. Each entry counts its connected users and the client is closed when
+# the last one disconnects.
+_SharedClientKey = Tuple[str, str, asyncio.AbstractEventLoop]
+_SHARED_CLIENTS: Dict[_SharedClientKey, httpx.AsyncClient] = {}
+_SHARED_CLIENT_USERS: Dict[_SharedClientKey, int] = {}
+_SHARED_CLIENTS_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Monotonic time of the last successful health check per satellite URL;
+# connect() skips the probe while it is younger than HEALTH_CHECK_TTL seconds
+_HEALTH_CACHE: Dict[str, float] = {}
+HEALTH_CHECK_TTL = 30.0
+
+
+def _shared_clients_lock() -> asyncio.Lock:
+    """Lock guarding the shared client pool, one per running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _SHARED_CLIENTS_LOCKS.get(loop)
+    if lock is None:
+        lock = _SHARED_CLIENTS_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+@functools.lru_cache(maxsize=None)
+def _raw_satellite_url(satellite_url: str) -> str:
+    """
+    Ensure we use .raw.icp0.io for API access.
+    
+    Cached, since clients are created far more often than the handful of
+    configured satellite URLs changes.
+    """
+    if '.icp0.io' in satellite_url and '.raw.icp0.io' not in satellite_url:
+        return satellite_url.replace('.icp0.io', '.raw.icp0.io')
+    return satellite_url
+
 
 class ICPOpenXAIClient:
     """
@@ -43,13 +187,34 @@ class ICPOpenXAIClient:
             satellite_url: Override default satellite URL
         """
         self.satellite_id = satellite_id or get_satellite_id()
-        self.satellite_url = satellite_url or get_satellite_url()
-        # Ensure we use .raw.icp0.io for API access
-        if '.icp0.io' in self.satellite_url and '.raw.icp0.io' not in self.satellite_url:
-            self.satellite_url = self.satellite_url.replace('.icp0.io', '.raw.icp0.io')
+        self.satellite_url = _raw_satellite_url(satellite_url or get_satellite_url())
         self.api_endpoint = f"{self.satellite_url.rstrip('/')}/api/v1"
+        
+        # Absolute endpoint URLs, parsed once instead of merged with the
+        # client's base URL on every request
+        self._url_health = httpx.URL(f"{self.api_endpoint}/health")
+        self._url_explain = httpx.URL(f"{self.api_endpoint}/explain")
+        self._url_explain_batch = httpx.URL(f"{self.api_endpoint}/explain_batch")
+        self._url_models = httpx.URL(f"{self.api_endpoint}/models")
+        self._url_verify = httpx.URL(f"{self.api_endpoint}/verify")
+        self._url_verify_batch = httpx.URL(f"{self.api_endpoint}/verify_batch")
+        self._url_status = httpx.URL(f"{self.api_endpoint}/status")
         self.auth_method = get_auth_method()
         self.session = None
+        self._session_key: Optional[_SharedClientKey] = None
+        
+        # Explain request coalescing, started by connect()
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_flusher_task: Optional[asyncio.Task] = None
+        self._batch_flushes: set = set()
+        self._explain_batch_supported = True
+        
+        # Results for identical requests are deterministic, so reuse them
+        # instead of paying another round-trip and inference cycles
+        self._explanation_cache: OrderedDict = OrderedDict()
+        self._verified_cache: OrderedDict = OrderedDict()
+        self._models_cache: Optional[Tuple[float, List[AIModelInfo]]] = None
+        
         self._headers = {
             "Content-Type": "application/json",
             "X-Satellite-ID": self.satellite_id,
@@ -68,26 +233,91 @@ class ICPOpenXAIClient:
     async def connect(self):
         """Establish connection to ICP-OpenXAI satellite"""
         if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=ZIGGURAT_CONFIG["icp_openxai"]["timeout"])
-            self.session = aiohttp.ClientSession(timeout=timeout, headers=self._headers)
+            key = (self.satellite_url, self.satellite_id, asyncio.get_running_loop())
+            async with _shared_clients_lock():
+                client = _SHARED_CLIENTS.get(key)
+                if client is None or client.is_closed:
+                    client = _SHARED_CLIENTS[key] = httpx.AsyncClient(
+                        base_url=self.api_endpoint,
+                        headers=self._headers,
+                        timeout=ZIGGURAT_CONFIG["icp_openxai"]["timeout"],
+                        limits=CONNECTION_LIMITS,
+                        # All endpoints share one host, so concurrent calls can be
+                        # multiplexed over a single connection
+                        http2=True
+                    )
+                    _SHARED_CLIENT_USERS[key] = 0
+                _SHARED_CLIENT_USERS[key] += 1
+            self.session = client
+            self._session_key = key
+            
+        if self._batch_flusher_task is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_flusher_task = asyncio.create_task(self._batch_flusher())
+            
+        # Verify satellite connectivity, unless it was confirmed recently
+        if time.monotonic() - _HEALTH_CACHE.get(self.satellite_url, float("-inf")) < HEALTH_CHECK_TTL:
+            return
             
-        # Verify satellite connectivity
         try:
-            async with self.session.get(f"{self.api_endpoint}/health") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Connected to Ziggurat satellite: {data.get('satellite_name', 'unknown')}")
-                else:
-                    logger.warning(f"Satellite health check returned status {response.status}")
+            response = await self.session.get(self._url_health)
+            if response.status_code == 200:
+                _HEALTH_CACHE[self.satellite_url] = time.monotonic()
+                data = _json_loads(response.content)
+                logger.info(
+                    f"Connected to Ziggurat satellite: {data.get('satellite_name', 'unknown')} "
+                    f"({response.http_version})"
+                )
+            else:
+                logger.warning(f"Satellite health check returned status {response.status_code}")
         except Exception as e:
             logger.error(f"Failed to connect to satellite: {e}")
             
     async def disconnect(self):
         """Close connection to satellite"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        if self._batch_flusher_task:
+            self._batch_flusher_task.cancel()
+            await asyncio.gather(self._batch_flusher_task, *self._batch_flushes, return_exceptions=True)
+            
+            # Fail requests that were queued but never flushed
+            while not self._batch_queue.empty():
+                _, future = self._batch_queue.get_nowait()
+                if not future.done():
+                    future.set_exception(ConnectionError("Client disconnected"))
+                    
+            self._batch_flusher_task = None
+            self._batch_queue = None
             
+        if self.session is None:
+            return
+            
+        # The HTTP client is shared with other instances; close it only when
+        # this was its last user
+        client, key = self.session, self._session_key
+        self.session = None
+        self._session_key = None
+        async with _shared_clients_lock():
+            last_user = False
+            if _SHARED_CLIENTS.get(key) is client:
+                _SHARED_CLIENT_USERS[key] -= 1
+                last_user = _SHARED_CLIENT_USERS[key] <= 0
+                if last_user:
+                    del _SHARED_CLIENTS[key]
+                    del _SHARED_CLIENT_USERS[key]
+        if last_user:
+            await client.aclose()
+            
+    @classmethod
+    async def shutdown_shared(cls):
+        """Close the running loop's shared HTTP clients, e.g. on application shutdown"""
+        loop = asyncio.get_running_loop()
+        async with _shared_clients_lock():
+            keys = [key for key in _SHARED_CLIENTS if key[2] is loop]
+            clients = [_SHARED_CLIENTS.pop(key) for key in keys]
+            for key in keys:
+                del _SHARED_CLIENT_USERS[key]
+        await asyncio.gather(*(client.aclose() for client in clients))
+        
     async def explain(
         self,
         data: Dict[str, Any],
@@ -105,89 +335,212 @@ class ICPOpenXAIClient:
         Returns:
             ZigguratExplanation with results
         """
+        try:
+            cache_key = hashlib.sha256(json.dumps(
+                {"d": data, "m": method.value, "id": model_id}, sort_keys=True, default=str
+            ).encode()).digest()
+        except TypeError:
+            # Keys that cannot be sorted (mixed types); skip the cache
+            cache_key = None
+        if cache_key is not None:
+            cached = self._cache_get(self._explanation_cache, cache_key)
+            if cached is not None:
+                # Explanations are mutable (callers set transaction_id and
+                # the like), so every caller gets its own copy
+                return copy.deepcopy(cached)
+            
         if not self.session:
             await self.connect()
             
-        payload = {
-            "data": data,
-            "method": method.value,
-            "model_id": model_id,
-            "request_id": self._generate_request_id(),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        payload = _EXPLAIN_PAYLOAD_TEMPLATE.copy()
+        payload["data"] = data
+        payload["method"] = method.value
+        payload["model_id"] = model_id
+        payload["request_id"] = self._generate_request_id()
+        payload["timestamp"] = datetime.utcnow().isoformat()
         
         try:
-            async with self.session.post(
-                f"{self.api_endpoint}/explain",
-                json=payload
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return self._parse_explanation(result)
-                else:
-                    error_data = await response.text()
-                    raise Exception(f"Explanation request failed: {error_data}")
-                    
+            if self._batch_queue is not None:
+                future = asyncio.get_running_loop().create_future()
+                self._batch_queue.put_nowait((payload, future))
+                result = await future
+            else:
+                result = await self._post_explain(payload)
+            explanation = self._parse_explanation(result)
+            if cache_key is not None:
+                self._cache_put(self._explanation_cache, cache_key, copy.deepcopy(explanation))
+            return explanation
+                
         except Exception as e:
             logger.error(f"ICP-OpenXAI request failed: {e}")
             # Return mock explanation for development
             return self._mock_explanation(data, method)
             
+    async def explain_many(
+        self,
+        items: List[Dict[str, Any]],
+        method: ExplanationMethod = ExplanationMethod.SHAP,
+        model_id: Optional[str] = None,
+        num_workers: int = 8
+    ) -> List[ZigguratExplanation]:
+        """
+        Get explanations for many inputs with bounded concurrency.
+        
+        A fixed pool of workers drains a queue of inputs, so at most
+        num_workers requests are in flight while the rest wait client-side.
+        
+        Args:
+            items: Input data for each explanation
+            method: Explanation method to use
+            model_id: Specific model ID (optional)
+            num_workers: Maximum number of concurrent requests
+            
+        Returns:
+            ZigguratExplanation per input, in submission order
+        """
+        if not self.session:
+            await self.connect()
+            
+        results: List[Optional[ZigguratExplanation]] = [None] * len(items)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, data in enumerate(items):
+            queue.put_nowait((index, data))
+            
+        async def worker():
+            while True:
+                index, data = await queue.get()
+                try:
+                    results[index] = await self.explain(data, method, model_id)
+                finally:
+                    queue.task_done()
+                    
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(num_workers, len(items)))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+        return results
+        
     async def list_models(self) -> List[AIModelInfo]:
         """Get available AI models from satellite"""
+        now = time.monotonic()
+        if self._models_cache and now - self._models_cache[0] < MODELS_CACHE_TTL:
+            return self._models_cache[1]
+            
         if not self.session:
             await self.connect()
             
         try:
-            async with self.session.get(f"{self.api_endpoint}/models") as response:
-                if response.status == 200:
-                    models_data = await response.json()
-                    return [self._parse_model_info(m) for m in models_data.get("models", [])]
-                else:
-                    logger.warning("Failed to fetch models list")
-                    return self._mock_models()
-                    
+            response = await self.session.get(self._url_models)
+            if response.status_code == 200:
+                models_data = _json_loads(response.content)
+                models = list(map(self._parse_model_info, models_data.get("models", ())))
+                self._models_cache = (now, models)
+                return models
+            else:
+                logger.warning("Failed to fetch models list")
+                return self._mock_models()
+                
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
             return self._mock_models()
             
+    def invalidate_models_cache(self):
+        """Drop the cached model catalog, e.g. after deploying a new model"""
+        self._models_cache = None
+        
     async def verify_on_chain(self, proof_hash: str) -> bool:
         """Verify proof hash on ICP blockchain"""
+        # Only positive results are cached: a proof not verified yet may be
+        # confirmed later, but a verified proof stays verified
+        if self._cache_get(self._verified_cache, proof_hash):
+            return True
+            
         if not self.session:
             await self.connect()
             
         try:
-            async with self.session.post(
-                f"{self.api_endpoint}/verify",
-                json={"proof_hash": proof_hash}
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get("verified", False)
-                else:
-                    return False
-                    
+            response = await self.session.post(self._url_verify, content=_json_dumps({"proof_hash": proof_hash}))
+            if response.status_code == 200:
+                verified = _json_loads(response.content).get("verified", False)
+                if verified:
+                    self._cache_put(self._verified_cache, proof_hash, True)
+                return verified
+            else:
+                return False
+                
         except Exception as e:
             logger.error(f"Chain verification failed: {e}")
             return False
             
+    async def verify_on_chain_many(self, proof_hashes: List[str]) -> List[bool]:
+        """
+        Verify many proof hashes on ICP blockchain in one round-trip.
+        
+        Hashes already known to be verified are answered from the cache;
+        the rest are sent together to /verify_batch.
+        
+        Args:
+            proof_hashes: Proof hashes to verify
+            
+        Returns:
+            Verification result per hash, in input order
+        """
+        verified = {
+            proof_hash: True for proof_hash in proof_hashes
+            if self._cache_get(self._verified_cache, proof_hash)
+        }
+        pending = list(dict.fromkeys(h for h in proof_hashes if h not in verified))
+        if not pending:
+            return [True] * len(proof_hashes)
+            
+        if not self.session:
+            await self.connect()
+            
+        try:
+            response = await self.session.post(
+                self._url_verify_batch, content=_json_dumps({"proof_hashes": pending})
+            )
+            if response.status_code == 200:
+                for result in _json_loads(response.content).get("results", []):
+                    if result.get("verified", False):
+                        verified[result["hash"]] = True
+                        self._cache_put(self._verified_cache, result["hash"], True)
+            elif response.status_code == 404:
+                # Satellite without batch support: verify individually
+                results = await asyncio.gather(*(self.verify_on_chain(h) for h in pending))
+                verified.update((h, True) for h, ok in zip(pending, results) if ok)
+            else:
+                logger.warning(f"Batch chain verification returned status {response.status_code}")
+                
+        except Exception as e:
+            logger.error(f"Batch chain verification failed: {e}")
+            
+        return [verified.get(proof_hash, False) for proof_hash in proof_hashes]
+        
     async def get_satellite_status(self) -> Dict[str, Any]:
         """Get current satellite status and metrics"""
         if not self.session:
             await self.connect()
             
         try:
-            async with self.session.get(f"{self.api_endpoint}/status") as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {
-                        "status": "unknown",
-                        "satellite_id": self.satellite_id,
-                        "cycles": "unknown",
-                        "memory": "unknown"
-                    }
-                    
+            response = await self.session.get(self._url_status)
+            if response.status_code == 200:
+                return _json_loads(response.content)
+            else:
+                return {
+                    "status": "unknown",
+                    "satellite_id": self.satellite_id,
+                    "cycles": "unknown",
+                    "memory": "unknown"
+                }
+                
         except Exception as e:
             logger.error(f"Failed to get satellite status: {e}")
             return {
@@ -196,47 +549,156 @@ class ICPOpenXAIClient:
                 "satellite_id": self.satellite_id
             }
             
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: Any) -> Any:
+        """Look up key in an LRU cache, marking it most recently used"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+        
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: Any, value: Any):
+        """Store key in an LRU cache, evicting the least recently used entry"""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+            
+    async def _post_with_retry(self, url: httpx.URL, body: bytes) -> Tuple[int, bytearray]:
+        """
+        POST body, retrying connection errors, timeouts and 5xx responses.
+        
+        The response body is streamed into a single growing buffer rather
+        than collected as chunks and joined, so large explanations (long
+        decision paths from the neural models) are not held twice in memory.
+        
+        Returns:
+            Status code and raw response body
+        """
+        for attempt in range(EXPLAIN_MAX_RETRIES + 1):
+            try:
+                async with self.session.stream("POST", url, content=body) as response:
+                    if response.status_code < 500 or attempt == EXPLAIN_MAX_RETRIES:
+                        content = bytearray()
+                        async for chunk in response.aiter_bytes():
+                            content += chunk
+                        return response.status_code, content
+                error = f"status {response.status_code}"
+            except (httpx.ConnectError, httpx.TimeoutException) as e:
+                if attempt == EXPLAIN_MAX_RETRIES:
+                    raise
+                error = e
+                
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            logger.warning(
+                f"POST {url} failed ({error}), retrying in {delay:.2f}s "
+                f"({attempt + 1}/{EXPLAIN_MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+            
+    async def _post_explain(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single explanation request"""
+        status, content = await self._post_with_retry(self._url_explain, _json_dumps(payload))
+        if status == 200:
+            return _json_loads(content)
+        else:
+            raise Exception(f"Explanation request failed: {content.decode(errors='replace')}")
+            
+    async def _batch_flusher(self):
+        """Collect queued explain requests into batches and send them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + EXPLAIN_BATCH_MAX_WAIT
+            
+            while len(batch) < EXPLAIN_BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                    
+            # Send without waiting, so the next batch can start collecting
+            flush = asyncio.create_task(self._flush_explain_batch(batch))
+            self._batch_flushes.add(flush)
+            flush.add_done_callback(self._batch_flushes.discard)
+            
+    async def _flush_explain_batch(self, batch: List[tuple]):
+        """Send one batch of explain requests and resolve their futures"""
+        payloads = [payload for payload, _ in batch]
+        try:
+            if len(batch) > 1 and self._explain_batch_supported:
+                try:
+                    status, content = await self._post_with_retry(
+                        self._url_explain_batch, _json_dumps({"requests": payloads})
+                    )
+                    if status == 200:
+                        results = _json_loads(content).get("results", [])
+                        if len(results) != len(batch):
+                            raise Exception(
+                                f"Explanation batch returned {len(results)} results for {len(batch)} requests"
+                            )
+                        for (_, future), result in zip(batch, results):
+                            if not future.done():
+                                future.set_result(result)
+                        return
+                    elif status == 404:
+                        logger.info("Satellite has no /explain_batch endpoint, sending explanations individually")
+                        self._explain_batch_supported = False
+                    else:
+                        raise Exception(f"Explanation batch request failed: {content.decode(errors='replace')}")
+                except Exception as e:
+                    # One bad payload or a failed batch must not fail every
+                    # request that shared its window; retry them one by one
+                    logger.warning(f"Explanation batch failed ({e}), sending explanations individually")
+                    
+            results = await asyncio.gather(
+                *(self._post_explain(payload) for payload in payloads),
+                return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+                    
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+                    
     def _generate_request_id(self) -> str:
         """Generate unique request ID"""
-        data = f"{self.satellite_id}-{datetime.utcnow().isoformat()}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        data = f"{self.satellite_id}-{time.time_ns()}"
+        return hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
         
     def _parse_explanation(self, data: Dict[str, Any]) -> ZigguratExplanation:
         """Parse API response into ZigguratExplanation"""
+        fields = _EXPLANATION_DEFAULTS.copy()
+        fields.update((key, data[key]) for key in _EXPLANATION_FIELDS.intersection(data))
+        fields.setdefault("feature_importance", {})
         return ZigguratExplanation(
-            reasoning=data.get("reasoning", ""),
-            confidence=data.get("confidence", 0.0),
             method_used=ExplanationMethod(data.get("method", "shap")),
-            blockchain_verified=data.get("blockchain_verified", False),
-            proof_hash=data.get("proof_hash"),
             verification_chain=BlockchainNetwork.ICP,
-            transaction_id=data.get("transaction_id"),
-            feature_importance=data.get("feature_importance", {}),
-            decision_path=data.get("decision_path", []),
-            counterfactuals=data.get("counterfactuals", []),
-            processing_time_ms=data.get("processing_time_ms", 0),
-            cost_cycles=data.get("cost_cycles", 0),
-            model_id=data.get("model_id"),
-            cross_chain_proofs=data.get("cross_chain_proofs", {})
+            **fields
         )
         
     def _parse_model_info(self, data: Dict[str, Any]) -> AIModelInfo:
         """Parse model data into AIModelInfo"""
+        fields = _MODEL_INFO_DEFAULTS.copy()
+        fields["canister_id"] = self.satellite_id
+        fields.update((key, data[key]) for key in _MODEL_INFO_FIELDS.intersection(data))
         return AIModelInfo(
-            model_id=data.get("model_id", ""),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            model_type=data.get("model_type", ""),
             supports_explanation=[
                 ExplanationMethod(m) for m in data.get("supports_explanation", [])
             ],
-            max_input_size=data.get("max_input_size", 0),
-            output_format=data.get("output_format", "json"),
             deployed_on=BlockchainNetwork.ICP,
-            canister_id=data.get("canister_id", self.satellite_id),
-            cost_per_inference=data.get("cost_per_inference", 1000000),
-            gpu_enabled=data.get("gpu_enabled", False),
-            memory_requirements_gb=data.get("memory_requirements_gb", 0.0)
+            **fields
         )
         
     def _mock_explanation(self, data: Any, method: ExplanationMethod) -> ZigguratExplanation:
@@ -246,7 +708,7 @@ class ICPOpenXAIClient:
             confidence=0.85,
             method_used=method,
             blockchain_verified=True,
-            proof_hash=hashlib.sha256(f"{self.satellite_id}-{data}".encode()).hexdigest(),
+            proof_hash=_mock_hash(f"{self.satellite_id}-{data}".encode()),
             verification_chain=BlockchainNetwork.ICP,
             transaction_id=f"icp-{self.satellite_id[:8]}-mock",
             feature_importance={"feature_1": 0.4, "feature_2": 0.35, "feature_3": 0.25},
@@ -310,6 +772,8 @@ async def test_satellite_connection():
         print(f"  Confidence: {explanation.confidence:.2%}")
         print(f"  Proof Hash: {explanation.proof_hash}")
         print(f"  Satellite: {client.satellite_id}")
+        
+    await ICPOpenXAIClient.shutdown_shared()
 
 
 if __name__ == "__main__":
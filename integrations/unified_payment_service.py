@@ -6,18 +6,121 @@ Masumi rewards and Ziggurat AI service billing.
 """
 
 import asyncio
+import functools
 import hashlib
+import heapq
+import itertools
 import json
+import logging
+import os
+import time
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Awaitable, Callable, Deque, Dict, Any, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 from decimal import Decimal
+from operator import attrgetter
 
 from ..billing.models import SubscriptionTier, PaymentMethod
 from ..billing.services.transaction_processing_service import TransactionProcessingService
 from ..blockchain.masumi_integration import MasumiTaskReward
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Currencies reported by balance summaries
+BALANCE_CURRENCIES: Tuple[str, ...] = ("MASUMI", "ICP", "TON", "ADA")
+
+# AI service pricing is done in integer pico-tokens (1e-12 of a token),
+# which is exact for every rate below; amounts become Decimal at the edge
+_PICO = Decimal(10 ** 12)
+
+# Pico-tokens charged per cycle, by currency
+_PICO_PER_CYCLE: Mapping[str, int] = MappingProxyType({
+    "ICP": 100_000,        # 0.1 ICP per 1M cycles
+    "TON": 250_000,        # 0.25 TON per 1M cycles
+    "ADA": 1_250_000,      # 1.25 ADA per 1M cycles
+    "MASUMI": 10_000_000   # 10 MASUMI per 1M cycles
+})
+
+# Pico-tokens charged per cycle, by payment method
+_PICO_PER_CYCLE_BY_METHOD: Mapping[PaymentMethod, int] = MappingProxyType({
+    PaymentMethod.ICP: _PICO_PER_CYCLE["ICP"],
+    PaymentMethod.TON: _PICO_PER_CYCLE["TON"],
+    PaymentMethod.CARDANO: _PICO_PER_CYCLE["ADA"]
+})
+
+# Rate for payment methods without a configured price (1 token per 1M cycles)
+_DEFAULT_PICO_PER_CYCLE = 1_000_000
+
+# Blockchain network each token settles on
+_TOKEN_CHAINS: Mapping[str, str] = MappingProxyType({
+    "MASUMI": "cardano",
+    "ICP": "icp",
+    "TON": "ton",
+    "ADA": "cardano",
+    "NURU": "cardano"
+})
+
+_EPOCH = datetime(1970, 1, 1)
+
+@functools.lru_cache(maxsize=4096)
+def _estimate_cost_core(
+    estimated_cycles: int,
+    usd_rates: Tuple[Tuple[str, Decimal], ...]
+) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Cost of a number of cycles in every priced currency.
+    
+    Cached on its arguments; the USD rates are part of the key, so a rate
+    refresh never returns stale estimates.
+    
+    Returns:
+        (currency, amount, usd_equivalent) per currency, amounts as strings
+    """
+    estimates = []
+    for currency, usd_rate in usd_rates:
+        cost = Decimal(estimated_cycles * _PICO_PER_CYCLE[currency]) / _PICO
+        estimates.append((currency, str(cost), str(cost * usd_rate)))
+    return tuple(estimates)
+
+
+# Settles one chain's batch of payments, returning a transaction hash per payment
+ChainSettlementHandler = Callable[[List["UnifiedPayment"]], Awaitable[List[str]]]
+
+# Persists payments evicted from memory, given as to_dict() records
+PaymentArchiver = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the payment field types JSON has no native form for."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj: Any) -> bytes:
+        # orjson encodes datetimes and enums natively; Decimal goes to default
+        return orjson.dumps(obj, default=_json_default)
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
+# Rate used for same-currency and unknown conversions
+_DECIMAL_ONE = Decimal("1.0")
+
 
 class PaymentType(Enum):
     """Types of payments in the unified system."""
@@ -28,7 +131,20 @@ class PaymentType(Enum):
     EXPLANATION_FEE = "explanation_fee" # Fee for AI explanations
 
 
-@dataclass
+class Currency(str, Enum):
+    """
+    Currencies with exchange rates in the unified system.
+    
+    Members are strings, so plain currency codes are still accepted
+    wherever a Currency is expected.
+    """
+    MASUMI = "MASUMI"
+    ICP = "ICP"
+    TON = "TON"
+    ADA = "ADA"
+
+
+@dataclass(slots=True)
 class UnifiedPayment:
     """Unified payment record across all platforms."""
     payment_id: str
@@ -42,10 +158,15 @@ class UnifiedPayment:
     blockchain_network: str
     transaction_hash: Optional[str]
     status: str
-    created_at: datetime
+    created_at: int  # Wall-clock nanoseconds since the epoch (time.time_ns)
     completed_at: Optional[datetime]
     metadata: Dict[str, Any]
     
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a naive UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.created_at // 1000)
+        
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -60,10 +181,34 @@ class UnifiedPayment:
             "blockchain_network": self.blockchain_network,
             "transaction_hash": self.transaction_hash,
             "status": self.status,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_dt.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "metadata": self.metadata
         }
+        
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON bytes, with the same fields as to_dict().
+        
+        Field values are handed to the encoder as they are, so no
+        intermediate string conversions are done in Python.
+        """
+        return _json_dumps({
+            "payment_id": self.payment_id,
+            "payment_type": self.payment_type,
+            "amount": self.amount,
+            "currency": self.currency,
+            "source_platform": self.source_platform,
+            "destination_platform": self.destination_platform,
+            "sender_id": self.sender_id,
+            "recipient_id": self.recipient_id,
+            "blockchain_network": self.blockchain_network,
+            "transaction_hash": self.transaction_hash,
+            "status": self.status,
+            "created_at": self.created_at_dt,
+            "completed_at": self.completed_at,
+            "metadata": self.metadata
+        })
 
 
 class UnifiedPaymentService:
@@ -79,7 +224,10 @@ class UnifiedPaymentService:
         self,
         transaction_service: TransactionProcessingService,
         enable_cross_chain: bool = True,
-        settlement_interval_hours: int = 24
+        settlement_interval_hours: int = 24,
+        settlement_batch_threshold: int = 256,
+        max_payments_in_memory: int = 1_000_000,
+        archive: Optional[PaymentArchiver] = None
     ):
         """
         Initialize unified payment service.
@@ -88,24 +236,53 @@ class UnifiedPaymentService:
             transaction_service: Multi-chain transaction processor
             enable_cross_chain: Enable cross-chain transfers
             settlement_interval_hours: Batch settlement interval
+            settlement_batch_threshold: Pending payments that trigger an
+                early settlement run
+            max_payments_in_memory: Payments kept in memory before the
+                oldest finished ones are evicted
+            archive: Coroutine function receiving evicted payment records;
+                without one, evicted payments are dropped (balances are
+                unaffected, but they leave the payment history)
         """
         self.transaction_service = transaction_service
         self.enable_cross_chain = enable_cross_chain
         self.settlement_interval = timedelta(hours=settlement_interval_hours)
+        self.settlement_batch_threshold = settlement_batch_threshold
+        self.max_payments_in_memory = max_payments_in_memory
+        self._archive = archive
+        self._archive_buffer: List[Dict[str, Any]] = []
         
-        # Payment tracking
+        # Payment tracking, indexed by user so history and balance lookups
+        # do not scan every payment
         self._payments: Dict[str, UnifiedPayment] = {}
-        self._pending_settlements: List[UnifiedPayment] = []
-        self._exchange_rates: Dict[str, Dict[str, float]] = {
+        self._user_payments: Dict[str, Dict[str, UnifiedPayment]] = defaultdict(dict)
+        # Finished (completed or failed) payment IDs, oldest first; only
+        # these can be evicted, so eviction never has to skip pending ones
+        self._finished_payment_ids: Deque[str] = deque()
+        self._balances: Dict[str, Dict[str, Decimal]] = {}
+        self._pending_settlements: Deque[UnifiedPayment] = deque()
+        self.refresh_rates({
             "MASUMI": {"USD": 0.10, "ICP": 0.02, "TON": 0.05, "ADA": 0.25},
             "ICP": {"USD": 5.0, "MASUMI": 50.0, "TON": 2.5, "ADA": 12.5},
             "TON": {"USD": 2.0, "MASUMI": 20.0, "ICP": 0.4, "ADA": 5.0},
             "ADA": {"USD": 0.40, "MASUMI": 4.0, "ICP": 0.08, "TON": 0.2}
-        }
+        })
+        
+        # Payment IDs come from a counter, salted per instance so separate
+        # service instances do not hand out the same IDs; each ID copies
+        # the pre-initialized hasher instead of setting one up per call
+        self._id_counter = itertools.count()
+        self._id_proto = hashlib.blake2b(digest_size=8, salt=os.urandom(16))
+        self._id_proto.update(b"ziggurat-payment-id\x00")
         
         # Settlement configuration
         self._settlement_task: Optional[asyncio.Task] = None
         self._last_settlement: Optional[datetime] = None
+        self._settle_event = asyncio.Event()
+        
+        # Chain-specific batch settlement, looked up once per chain batch;
+        # chains without a handler use the generic simulated settlement
+        self._chain_handlers: Dict[str, ChainSettlementHandler] = {}
         
     async def start(self):
         """Start the payment service with auto-settlement."""
@@ -121,6 +298,7 @@ class UnifiedPaymentService:
             except asyncio.CancelledError:
                 pass
             self._settlement_task = None
+        await self._flush_archive()
             
     async def process_ai_service_payment(
         self,
@@ -144,15 +322,9 @@ class UnifiedPaymentService:
             UnifiedPayment record
         """
         # Calculate cost based on cycles
-        cost_per_million_cycles = {
-            PaymentMethod.ICP: Decimal("0.1"),    # 0.1 ICP per 1M cycles
-            PaymentMethod.TON: Decimal("0.25"),   # 0.25 TON per 1M cycles
-            PaymentMethod.CARDANO: Decimal("1.25") # 1.25 ADA per 1M cycles
-        }
-        
         currency = payment_method.value.upper()
-        rate = cost_per_million_cycles.get(payment_method, Decimal("1.0"))
-        amount = (Decimal(cycles_used) / Decimal(1_000_000)) * rate
+        rate = _PICO_PER_CYCLE_BY_METHOD.get(payment_method, _DEFAULT_PICO_PER_CYCLE)
+        amount = Decimal(cycles_used * rate) / _PICO
         
         # Create payment record
         payment = UnifiedPayment(
@@ -167,7 +339,7 @@ class UnifiedPaymentService:
             blockchain_network=currency.lower(),
             transaction_hash=None,
             status="pending",
-            created_at=datetime.utcnow(),
+            created_at=time.time_ns(),
             completed_at=None,
             metadata={
                 "service_type": service_type,
@@ -184,14 +356,13 @@ class UnifiedPaymentService:
             description=f"AI Service: {service_type}"
         )
         
+        self._record_payment(payment)
         if result["success"]:
-            payment.transaction_hash = result["transaction_id"]
-            payment.status = "completed"
-            payment.completed_at = datetime.utcnow()
+            self._mark_completed(payment, result["transaction_id"])
         else:
-            payment.status = "failed"
+            self._mark_failed(payment)
             
-        self._payments[payment.payment_id] = payment
+        await self._flush_archive()
         return payment
         
     async def distribute_task_reward(
@@ -220,10 +391,10 @@ class UnifiedPaymentService:
             sender_id="masumi_treasury",
             recipient_id=task_reward.agent_id,
             blockchain_network=self._get_blockchain_for_token(task_reward.reward_token),
-            transaction_hash=task_reward.transaction_hash,
-            status="completed" if task_reward.transaction_hash else "pending",
-            created_at=datetime.utcnow(),
-            completed_at=datetime.utcnow() if task_reward.transaction_hash else None,
+            transaction_hash=None,
+            status="pending",
+            created_at=time.time_ns(),
+            completed_at=None,
             metadata={
                 "task_id": task_reward.task_id,
                 "quality_score": task_reward.quality_score,
@@ -231,18 +402,21 @@ class UnifiedPaymentService:
             }
         )
         
-        self._payments[payment.payment_id] = payment
+        self._record_payment(payment)
+        if task_reward.transaction_hash:
+            self._mark_completed(payment, task_reward.transaction_hash)
         
         # Add to settlement queue if cross-chain needed
         if self.enable_cross_chain and payment.status == "pending":
-            self._pending_settlements.append(payment)
+            self._queue_settlements(payment)
             
+        await self._flush_archive()
         return payment
         
     async def process_cross_chain_transfer(
         self,
-        from_currency: str,
-        to_currency: str,
+        from_currency: Currency,
+        to_currency: Currency,
         amount: Decimal,
         user_id: str,
         reason: str = "currency_conversion"
@@ -262,7 +436,7 @@ class UnifiedPaymentService:
         """
         # Calculate exchange
         exchange_rate = self._get_exchange_rate(from_currency, to_currency)
-        converted_amount = amount * Decimal(str(exchange_rate))
+        converted_amount = amount * exchange_rate
         
         # Create source payment (debit)
         source_payment = UnifiedPayment(
@@ -277,7 +451,7 @@ class UnifiedPaymentService:
             blockchain_network=self._get_blockchain_for_token(from_currency),
             transaction_hash=None,
             status="pending",
-            created_at=datetime.utcnow(),
+            created_at=time.time_ns(),
             completed_at=None,
             metadata={
                 "reason": reason,
@@ -299,7 +473,7 @@ class UnifiedPaymentService:
             blockchain_network=self._get_blockchain_for_token(to_currency),
             transaction_hash=None,
             status="pending",
-            created_at=datetime.utcnow(),
+            created_at=time.time_ns(),
             completed_at=None,
             metadata={
                 "reason": reason,
@@ -310,12 +484,12 @@ class UnifiedPaymentService:
         )
         
         # Add to payments
-        self._payments[source_payment.payment_id] = source_payment
-        self._payments[dest_payment.payment_id] = dest_payment
+        self._record_payment(source_payment, dest_payment)
         
         # Queue for settlement
-        self._pending_settlements.extend([source_payment, dest_payment])
+        self._queue_settlements(source_payment, dest_payment)
         
+        await self._flush_archive()
         return source_payment, dest_payment
         
     async def get_payment_history(
@@ -335,10 +509,10 @@ class UnifiedPaymentService:
         Returns:
             List of payments
         """
-        user_payments = [
-            p for p in self._payments.values()
-            if p.sender_id == user_id or p.recipient_id == user_id
-        ]
+        user_payments = self._user_payments.get(user_id)
+        if not user_payments:
+            return []
+        user_payments = user_payments.values()
         
         if payment_type:
             user_payments = [
@@ -346,10 +520,8 @@ class UnifiedPaymentService:
                 if p.payment_type == payment_type
             ]
             
-        # Sort by date descending
-        user_payments.sort(key=lambda p: p.created_at, reverse=True)
-        
-        return user_payments[:limit]
+        # Newest first; only the top `limit` entries are ordered
+        return heapq.nlargest(limit, user_payments, key=attrgetter("created_at"))
         
     async def get_balance_summary(self, user_id: str) -> Dict[str, Decimal]:
         """
@@ -361,25 +533,54 @@ class UnifiedPaymentService:
         Returns:
             Balance by currency
         """
-        balances = {
-            "MASUMI": Decimal("0"),
-            "ICP": Decimal("0"),
-            "TON": Decimal("0"),
-            "ADA": Decimal("0")
+        balances = self._balances.get(user_id)
+        if balances is None:
+            return {currency: Decimal("0") for currency in BALANCE_CURRENCIES}
+        return dict(balances)
+        
+    async def get_all_balances(self) -> Dict[str, Dict[str, Decimal]]:
+        """
+        Get balance summaries for every user with completed payments.
+        
+        Returns:
+            Balance by currency, keyed by user ID
+        """
+        return {
+            user_id: dict(balances)
+            for user_id, balances in self._balances.items()
         }
         
-        for payment in self._payments.values():
-            # Credits
-            if payment.recipient_id == user_id and payment.status == "completed":
-                if payment.currency in balances:
-                    balances[payment.currency] += payment.amount
-                    
-            # Debits
-            if payment.sender_id == user_id and payment.status == "completed":
-                if payment.currency in balances:
-                    balances[payment.currency] -= payment.amount
-                    
-        return balances
+    def refresh_rates(self, exchange_rates: Dict[str, Dict[str, float]]):
+        """
+        Replace the exchange rates used for conversions and estimates.
+        
+        The lookup table is rebuilt and swapped in as one object, so
+        concurrent conversions see either the old or the new rates.
+        
+        Args:
+            exchange_rates: Rates by source currency, then target currency
+        """
+        # Known codes are keyed by their Currency member, so lookups made
+        # with members match by identity
+        as_currency = Currency._value2member_map_.get
+        rate_table: Dict[Tuple[str, str], Decimal] = {
+            (as_currency(from_currency, from_currency), as_currency(to_currency, to_currency)):
+                Decimal(str(rate))
+            for from_currency, rates in exchange_rates.items()
+            for to_currency, rate in rates.items()
+        }
+        for currency in exchange_rates:
+            currency = as_currency(currency, currency)
+            rate_table[(currency, currency)] = _DECIMAL_ONE
+            
+        # Every priced currency needs a USD rate for cost estimates
+        usd_rates = tuple(
+            (currency, rate_table[(currency, "USD")]) for currency in _PICO_PER_CYCLE
+        )
+            
+        self._exchange_rates = exchange_rates
+        self._rate_table = rate_table
+        self._usd_rates = usd_rates
         
     async def estimate_service_cost(
         self,
@@ -398,22 +599,16 @@ class UnifiedPaymentService:
         Returns:
             Cost estimation details
         """
-        # Base costs per million cycles
-        costs_per_million = {
-            "ICP": Decimal("0.1"),
-            "TON": Decimal("0.25"),
-            "ADA": Decimal("1.25"),
-            "MASUMI": Decimal("10.0")
-        }
-        
         # Calculate for all currencies
-        estimates = {}
-        for currency, rate in costs_per_million.items():
-            cost = (Decimal(estimated_cycles) / Decimal(1_000_000)) * rate
-            estimates[currency] = {
-                "amount": str(cost),
-                "usd_equivalent": str(cost * Decimal(str(self._exchange_rates[currency]["USD"])))
+        estimates = {
+            currency: {
+                "amount": amount,
+                "usd_equivalent": usd_equivalent
             }
+            for currency, amount, usd_equivalent in _estimate_cost_core(
+                estimated_cycles, self._usd_rates
+            )
+        }
             
         return {
             "service_type": service_type,
@@ -437,86 +632,231 @@ class UnifiedPaymentService:
                 "status": "no_pending_settlements"
             }
             
+        # Take the current batch; payments queued while it settles wait
+        # for the next run
+        pending = list(self._pending_settlements)
+        self._pending_settlements.clear()
+        
         settlements_by_chain = {}
-        for payment in self._pending_settlements:
+        for payment in pending:
             chain = payment.blockchain_network
             if chain not in settlements_by_chain:
                 settlements_by_chain[chain] = []
             settlements_by_chain[chain].append(payment)
             
-        # Process each chain's settlements
+        # Settle all chains concurrently
+        chain_results = await asyncio.gather(
+            *(self._settle_chain(chain, payments)
+              for chain, payments in settlements_by_chain.items()),
+            return_exceptions=True
+        )
+        
         results = {
             "settlements_processed": 0,
             "settlements_by_chain": {},
             "failed_settlements": []
         }
         
-        for chain, payments in settlements_by_chain.items():
-            try:
-                # Batch process on chain
-                success_count = 0
-                total_amount = Decimal("0")
-                
-                for payment in payments:
-                    # Simulate settlement (would call actual blockchain APIs)
-                    payment.status = "completed"
-                    payment.completed_at = datetime.utcnow()
-                    payment.transaction_hash = f"{chain}-batch-{datetime.utcnow().timestamp()}"
-                    success_count += 1
-                    total_amount += payment.amount
-                    
-                results["settlements_by_chain"][chain] = {
-                    "count": success_count,
-                    "total_amount": str(total_amount)
-                }
-                results["settlements_processed"] += success_count
-                
-            except Exception as e:
+        for (chain, payments), chain_result in zip(settlements_by_chain.items(), chain_results):
+            if isinstance(chain_result, Exception):
                 results["failed_settlements"].append({
                     "chain": chain,
-                    "error": str(e),
+                    "error": str(chain_result),
                     "payment_count": len(payments)
                 })
+                continue
+            results["settlements_by_chain"][chain] = chain_result
+            results["settlements_processed"] += chain_result["count"]
                 
-        # Clear processed settlements
-        self._pending_settlements = [
-            p for p in self._pending_settlements
-            if p.status != "completed"
-        ]
+        # Requeue anything that did not settle
+        self._pending_settlements.extend(
+            p for p in pending if p.status != "completed"
+        )
         
         self._last_settlement = datetime.utcnow()
+        await self._flush_archive()
         return results
         
+    async def _settle_chain(
+        self,
+        chain: str,
+        payments: List[UnifiedPayment]
+    ) -> Dict[str, Any]:
+        """
+        Settle one chain's pending payments as a single batch.
+        
+        Args:
+            chain: Blockchain network
+            payments: Payments to settle on that chain
+            
+        Returns:
+            Settled count and total amount for the chain
+        """
+        handler = self._chain_handlers.get(chain, self._settle_generic)
+        transaction_hashes = await handler(payments)
+        
+        # Payments the handler returned no hash for stay pending
+        settled_count = 0
+        total_amount = Decimal("0")
+        for payment, transaction_hash in zip(payments, transaction_hashes):
+            self._mark_completed(payment, transaction_hash)
+            settled_count += 1
+            total_amount += payment.amount
+            
+        return {
+            "count": settled_count,
+            "total_amount": str(total_amount)
+        }
+        
+    async def _settle_generic(self, payments: List[UnifiedPayment]) -> List[str]:
+        """Simulated batch settlement for chains without a dedicated handler."""
+        # Would submit one batch to the chain's API
+        transaction_hash = f"{payments[0].blockchain_network}-batch-{time.monotonic_ns()}"
+        return [transaction_hash] * len(payments)
+        
+    def register_chain_handler(self, chain: str, handler: ChainSettlementHandler):
+        """
+        Register the batch settlement handler for a blockchain.
+        
+        Args:
+            chain: Blockchain network, as in UnifiedPayment.blockchain_network
+            handler: Coroutine function settling a list of payments and
+                returning one transaction hash per payment, in order
+        """
+        self._chain_handlers[chain] = handler
+        
+    def _queue_settlements(self, *payments: UnifiedPayment):
+        """Queue payments for settlement, waking the loop once enough are pending."""
+        self._pending_settlements.extend(payments)
+        if len(self._pending_settlements) >= self.settlement_batch_threshold:
+            self._settle_event.set()
+            
+    def _record_payment(self, *payments: UnifiedPayment):
+        """Store payments and add them to the per-user indexes."""
+        self._payments.update({payment.payment_id: payment for payment in payments})
+        user_payments = self._user_payments
+        for payment in payments:
+            user_payments[payment.sender_id][payment.payment_id] = payment
+            user_payments[payment.recipient_id][payment.payment_id] = payment
+            if payment.status == "completed":
+                self._apply_to_balances(payment)
+            if payment.status != "pending":
+                self._finished_payment_ids.append(payment.payment_id)
+        if len(self._payments) > self.max_payments_in_memory:
+            self._evict_payments()
+            
+    def _evict_payments(self):
+        """
+        Evict the oldest finished payments beyond the in-memory limit.
+        
+        Pending payments are never evicted. Eviction takes IDs from the
+        finished-payment queue, so its cost does not depend on how many
+        payments are still pending. Evicted payments are buffered for the
+        archive and written by _flush_archive.
+        """
+        payments = self._payments
+        user_payments = self._user_payments
+        finished = self._finished_payment_ids
+        while len(payments) > self.max_payments_in_memory and finished:
+            payment_id = finished.popleft()
+            payment = payments.pop(payment_id, None)
+            if payment is None:
+                continue
+            for user_id in (payment.sender_id, payment.recipient_id):
+                user_index = user_payments.get(user_id)
+                if user_index is not None:
+                    user_index.pop(payment_id, None)
+                    if not user_index:
+                        del user_payments[user_id]
+            if self._archive is not None:
+                self._archive_buffer.append(payment.to_dict())
+                
+    async def _flush_archive(self):
+        """
+        Hand buffered evicted payments to the archive in one call.
+        
+        If the archive fails, the records stay buffered for the next flush
+        so payment processing is not interrupted.
+        """
+        if not self._archive_buffer:
+            return
+        records, self._archive_buffer = self._archive_buffer, []
+        try:
+            await self._archive(records)
+        except Exception as e:
+            self._archive_buffer[:0] = records
+            logger.warning(f"Failed to archive {len(records)} payments: {e}")
+            
+    def _mark_completed(self, payment: UnifiedPayment, transaction_hash: str):
+        """Complete a recorded payment and update the affected balances."""
+        payment.status = "completed"
+        payment.completed_at = datetime.utcnow()
+        payment.transaction_hash = transaction_hash
+        self._apply_to_balances(payment)
+        self._finished_payment_ids.append(payment.payment_id)
+        
+    def _mark_failed(self, payment: UnifiedPayment):
+        """Fail a recorded payment, making it evictable."""
+        payment.status = "failed"
+        self._finished_payment_ids.append(payment.payment_id)
+        
+    def _apply_to_balances(self, payment: UnifiedPayment):
+        """Credit the recipient and debit the sender of a completed payment."""
+        if payment.currency not in BALANCE_CURRENCIES:
+            return
+        self._user_balances(payment.recipient_id)[payment.currency] += payment.amount
+        self._user_balances(payment.sender_id)[payment.currency] -= payment.amount
+        
+    def _user_balances(self, user_id: str) -> Dict[str, Decimal]:
+        """Running balances for a user, created on first use."""
+        balances = self._balances.get(user_id)
+        if balances is None:
+            balances = {currency: Decimal("0") for currency in BALANCE_CURRENCIES}
+            self._balances[user_id] = balances
+        return balances
+        
     def _generate_payment_id(self, prefix: str, user_id: str) -> str:
         """Generate unique payment ID."""
-        timestamp = datetime.utcnow().timestamp()
-        data = f"{prefix}-{user_id}-{timestamp}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        hasher = self._id_proto.copy()
+        hasher.update(f"{prefix}-{user_id}-{next(self._id_counter)}".encode())
+        return hasher.hexdigest()
         
-    def _get_blockchain_for_token(self, token: str) -> str:
+    def _get_blockchain_for_token(self, token: Union[Currency, str]) -> str:
         """Get blockchain network for a token."""
-        token_chains = {
-            "MASUMI": "cardano",
-            "ICP": "icp",
-            "TON": "ton",
-            "ADA": "cardano",
-            "NURU": "cardano"
-        }
-        return token_chains.get(token.upper(), "unknown")
+        chain = _TOKEN_CHAINS.get(token)
+        if chain is None:
+            chain = _TOKEN_CHAINS.get(token.upper(), "unknown")
+        return chain
         
-    def _get_exchange_rate(self, from_currency: str, to_currency: str) -> float:
+    def _get_exchange_rate(self, from_currency: Currency, to_currency: Currency) -> Decimal:
         """Get exchange rate between currencies."""
-        if from_currency == to_currency:
-            return 1.0
-            
-        from_rates = self._exchange_rates.get(from_currency.upper(), {})
-        return from_rates.get(to_currency.upper(), 1.0)
+        if from_currency is to_currency:
+            return _DECIMAL_ONE
+        rate = self._rate_table.get((from_currency, to_currency))
+        if rate is None:
+            # Not exact codes; retry case-insensitively
+            rate = self._rate_table.get(
+                (from_currency.upper(), to_currency.upper()), _DECIMAL_ONE
+            )
+        return rate
         
     async def _auto_settlement_loop(self):
-        """Background task for automatic settlement."""
+        """
+        Background task for automatic settlement.
+        
+        Settles every settlement interval, or earlier once the pending
+        queue reaches the batch threshold.
+        """
         while True:
             try:
-                await asyncio.sleep(self.settlement_interval.total_seconds())
+                try:
+                    await asyncio.wait_for(
+                        self._settle_event.wait(),
+                        timeout=self.settlement_interval.total_seconds()
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._settle_event.clear()
                 await self.process_batch_settlement()
             except asyncio.CancelledError:
                 break
@@ -0,0 +1,71 @@
+"""
+Shared pytest configuration.
+
+Tests marked ``slow`` (full integration flows) are skipped unless pytest is
+run with ``--run-slow``. ``asyncio.sleep`` raises during tests unless they are
+marked ``allow_sleep``, so mocks and stubs never wait on the real clock.
+Async tests run on uvloop when it is installed.
+"""
+
+import asyncio
+
+import pytest
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: full integration test, skipped without --run-slow")
+    config.addinivalue_line("markers", "allow_sleep: test may call asyncio.sleep")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Keep ungrouped tests together per file under --dist=loadgroup; this has
+    # to run before xdist reads the groups
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.nodeid.split("::")[0]))
+    
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+if UVLOOP_AVAILABLE:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Create pytest-asyncio event loops with uvloop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def forbid_asyncio_sleep(request, monkeypatch):
+    """Make asyncio.sleep raise unless the test is marked allow_sleep."""
+    if request.node.get_closest_marker("allow_sleep"):
+        return
+        
+    async def sleep(delay, result=None):
+        raise RuntimeError(
+            f"asyncio.sleep({delay!r}) called in a test; mark it allow_sleep if "
+            f"the wait is intended"
+        )
+        
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
@@ -6,10 +6,15 @@ including task discovery, explanation processing, rewards, and verification.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import copy
+import dataclasses
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import Mock, AsyncMock, patch
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Sequence
+from unittest.mock import Mock, AsyncMock
 
 from src.core.integrations import (
     MasumiZigguratBridge,
@@ -20,122 +25,167 @@ from src.core.integrations import (
     UnifiedPaymentService,
     BlockchainVerificationBridge
 )
-from src.core.integrations.integration_config import (
-    IntegrationConfig,
-    Environment,
-    get_integration_config
-)
 from src.core.blockchain.ziggurat import (
     ExplanationMethod,
     BlockchainNetwork,
     ZigguratExplanation
 )
-from src.core.blockchain.masumi_integration import (
-    MasumiTaskReward,
-    TaskStatus
+from src.core.blockchain.masumi_integration import MasumiTaskReward
+
+
+_EXPLANATION_METHOD_VALUES = tuple(m.value for m in ExplanationMethod)
+
+# Fixed clock for timestamped fixtures, so they are deterministic and can be
+# built once per session
+FROZEN_NOW = datetime(2024, 1, 1)
+FROZEN_NOW_NS = 1_704_067_200 * 1_000_000_000  # FROZEN_NOW as UTC epoch ns
+
+# Shared explanation fields; tests override what they check with
+# dataclasses.replace
+_BASE_EXPLANATION = ZigguratExplanation(
+    reasoning="Test explanation",
+    confidence=0.9,
+    method_used=ExplanationMethod.SHAP,
+    blockchain_verified=True,
+    proof_hash="0x" + "a" * 64,
+    verification_chain=BlockchainNetwork.ICP,
+    processing_time_ms=500,
+    cost_cycles=1_000_000
 )
 
+# Tasks listed by the mock Masumi client, read-only so a test cannot change
+# them for the rest of the session
+_TASK_001 = MappingProxyType({
+    "id": "task-001",
+    "type": "explainable_ai",
+    "description": "Explain prediction model output",
+    "reward_amount": 25.0,
+    "reward_token": "MASUMI",
+    "complexity": "medium",
+    "requires_explanation": True
+})
+_TASK_002 = MappingProxyType({
+    "id": "task-002",
+    "type": "feature_analysis",
+    "description": "Analyze feature importance",
+    "reward_amount": 50.0,
+    "reward_token": "MASUMI",
+    "complexity": "high"
+})
+_AVAILABLE_TASKS = (_TASK_001, _TASK_002)
 
-@pytest.fixture
-async def mock_masumi_client():
-    """Mock Masumi Network client."""
-    client = AsyncMock()
-    
-    # Mock registration
-    client.register_agent.return_value = {
-        "success": True,
-        "agent_id": "test-agent"
-    }
-    
-    # Mock task discovery
-    client.get_available_tasks.return_value = [
-        {
-            "id": "task-001",
-            "type": "explainable_ai",
-            "description": "Explain prediction model output",
-            "reward_amount": 25.0,
-            "reward_token": "MASUMI",
-            "complexity": "medium",
-            "requires_explanation": True
-        },
-        {
-            "id": "task-002",
-            "type": "feature_analysis",
-            "description": "Analyze feature importance",
-            "reward_amount": 50.0,
-            "reward_token": "MASUMI",
-            "complexity": "high"
-        }
-    ]
+# Reward returned by the mock Masumi client; read-only, so shared as-is
+_DEFAULT_REWARD = MasumiTaskReward(
+    task_id="task-001",
+    agent_id="test-agent",
+    reward_amount=25.0,
+    reward_token="MASUMI",
+    completion_time=FROZEN_NOW,
+    quality_score=0.85,
+    transaction_hash="masumi-tx-12345"
+)
+
+
+@dataclasses.dataclass
+class _FakeMasumiClient:
+    """Masumi client stub returning fixed responses, without Mock bookkeeping."""
     
-    # Mock task operations
-    client.claim_task.return_value = {"success": True}
-    client.submit_task_completion.return_value = {"success": True}
+    tasks: Sequence[Mapping[str, Any]]
+    reward: MasumiTaskReward
+    reputation: Dict[str, Any]
     
-    # Mock reward
-    client.claim_reward.return_value = MasumiTaskReward(
-        task_id="task-001",
-        agent_id="test-agent",
-        reward_amount=25.0,
-        reward_token="MASUMI",
-        completion_time=datetime.utcnow(),
-        quality_score=0.85,
-        transaction_hash="masumi-tx-12345"
-    )
-    
-    # Mock reputation
-    client.get_agent_reputation.return_value = {
-        "reputation_score": 0.75,
-        "total_tasks": 10
-    }
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+        
+    async def register_agent(self, **kwargs):
+        return {"success": True, "agent_id": "test-agent"}
+        
+    async def get_available_tasks(self, *args, **kwargs):
+        # Fresh dicts per call, like a real client; the bridge annotates them
+        return [dict(task) for task in self.tasks]
+        
+    async def claim_task(self, *args, **kwargs):
+        return {"success": True}
+        
+    async def submit_task_completion(self, *args, **kwargs):
+        return {"success": True}
+        
+    async def claim_reward(self, *args, **kwargs):
+        return self.reward
+        
+    async def get_agent_reputation(self, *args, **kwargs):
+        return self.reputation
+        
+    async def get_earnings_history(self, *args, **kwargs):
+        return []
+
+
+@dataclasses.dataclass
+class _FakeZigguratClient:
+    """Ziggurat client stub returning a fixed explanation."""
     
-    # Mock earnings
-    client.get_earnings_history.return_value = []
+    explanation: ZigguratExplanation
     
-    return client
+    async def initialize(self):
+        return None
+        
+    async def cleanup(self):
+        return None
+        
+    async def explain_decision(self, *args, **kwargs):
+        return self.explanation
+        
+    async def explain_with_counterfactuals(self, *args, **kwargs):
+        return self.explanation
+        
+    async def list_available_models(self):
+        return []
+        
+    async def verify_proof(self, *args, **kwargs):
+        return True
 
 
-@pytest.fixture
-async def mock_ziggurat_client():
+# The mock clients and bridge are read-only configuration, so they are
+# built once per session; reset_bridge_state undoes per-test mutations.
+
+@pytest.fixture(scope="session")
+def mock_masumi_client():
+    """Mock Masumi Network client."""
+    return _FakeMasumiClient(
+        tasks=_AVAILABLE_TASKS,
+        reward=_DEFAULT_REWARD,
+        reputation={
+            "reputation_score": 0.75,
+            "total_tasks": 10
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_ziggurat_client():
     """Mock Ziggurat Intelligence client."""
-    client = AsyncMock()
-    
-    # Mock initialization
-    client.initialize.return_value = None
-    client.cleanup.return_value = None
-    
-    # Mock explanation
-    explanation = ZigguratExplanation(
-        reasoning="High confidence prediction based on feature analysis",
-        confidence=0.88,
-        method_used=ExplanationMethod.SHAP,
-        blockchain_verified=True,
-        proof_hash="0x" + "a" * 64,
-        verification_chain=BlockchainNetwork.ICP,
-        transaction_id="icp-tx-67890",
-        feature_importance={
-            "feature_1": 0.65,
-            "feature_2": 0.25,
-            "feature_3": 0.10
-        },
-        processing_time_ms=750,
-        cost_cycles=1_500_000
+    return _FakeZigguratClient(
+        explanation=dataclasses.replace(
+            _BASE_EXPLANATION,
+            reasoning="High confidence prediction based on feature analysis",
+            confidence=0.88,
+            transaction_id="icp-tx-67890",
+            feature_importance={
+                "feature_1": 0.65,
+                "feature_2": 0.25,
+                "feature_3": 0.10
+            },
+            processing_time_ms=750,
+            cost_cycles=1_500_000
+        )
     )
-    
-    client.explain_decision.return_value = explanation
-    client.explain_with_counterfactuals.return_value = explanation
-    
-    # Mock model listing
-    client.list_available_models.return_value = []
-    
-    # Mock verification
-    client.verify_proof.return_value = True
-    
-    return client
 
 
-@pytest.fixture
-async def integration_bridge(mock_masumi_client, mock_ziggurat_client):
+@pytest.fixture(scope="session")
+def integration_bridge(mock_masumi_client, mock_ziggurat_client):
     """Create integration bridge with mocked clients."""
     bridge = MasumiZigguratBridge(
         masumi_api_key="test-api-key",
@@ -151,10 +201,17 @@ async def integration_bridge(mock_masumi_client, mock_ziggurat_client):
     return bridge
 
 
+@pytest.fixture(autouse=True)
+def reset_bridge_state(integration_bridge):
+    """Restore the shared bridge's caches after each test."""
+    yield
+    integration_bridge._task_cache.clear()
+    integration_bridge._explanation_cache.clear()
+
+
 class TestMasumiZigguratBridge:
     """Test the main integration bridge."""
     
-    @pytest.mark.asyncio
     async def test_bridge_initialization(self):
         """Test bridge initialization and configuration."""
         bridge = MasumiZigguratBridge(
@@ -169,17 +226,15 @@ class TestMasumiZigguratBridge:
         assert bridge.min_quality_threshold == 0.7
         assert bridge.auto_verify is True
     
-    @pytest.mark.asyncio
     async def test_discover_explainable_tasks(self, integration_bridge):
         """Test discovering explainable AI tasks."""
         tasks = await integration_bridge.discover_explainable_tasks()
         
         assert len(tasks) == 2
         assert tasks[0]["id"] == "task-001"
-        assert tasks[0]["supported_methods"] == [m.value for m in ExplanationMethod]
+        assert tasks[0]["supported_methods"] == list(_EXPLANATION_METHOD_VALUES)
         assert "estimated_cycles" in tasks[0]
     
-    @pytest.mark.asyncio
     async def test_process_explainable_task(self, integration_bridge):
         """Test processing an explainable AI task."""
         task_data = {"test": "data", "value": 42}
@@ -198,43 +253,35 @@ class TestMasumiZigguratBridge:
         assert result.reward is not None
         assert result.reward.reward_amount == 25.0
     
-    @pytest.mark.asyncio
-    async def test_cross_chain_verification(self, integration_bridge):
+    async def test_cross_chain_verification(self, integration_bridge, monkeypatch):
         """Test cross-chain verification feature."""
         task_data = {"test": "data"}
         
-        with patch.object(integration_bridge, '_cross_chain_verify') as mock_verify:
-            mock_verify.return_value = {
-                "ICP": "icp-proof-123",
-                "CARDANO": "ada-proof-456"
-            }
-            
-            result = await integration_bridge.process_explainable_task(
-                task_id="task-002",
-                task_data=task_data,
-                cross_chain_verify=True
-            )
-            
-            assert len(result.verification_proofs) == 2
-            assert "ICP" in result.verification_proofs
-            assert "CARDANO" in result.verification_proofs
-    
-    @pytest.mark.asyncio
+        monkeypatch.setattr(integration_bridge, "_cross_chain_verify", AsyncMock(return_value={
+            "ICP": "icp-proof-123",
+            "CARDANO": "ada-proof-456"
+        }))
+        
+        result = await integration_bridge.process_explainable_task(
+            task_id="task-002",
+            task_data=task_data,
+            cross_chain_verify=True
+        )
+        
+        assert len(result.verification_proofs) == 2
+        assert "ICP" in result.verification_proofs
+        assert "CARDANO" in result.verification_proofs
+    
     async def test_quality_scoring(self, integration_bridge):
         """Test explanation quality scoring."""
         # Create explanation with varying quality
-        explanation = ZigguratExplanation(
-            reasoning="Test explanation",
+        explanation = dataclasses.replace(
+            _BASE_EXPLANATION,
             confidence=0.95,
-            method_used=ExplanationMethod.SHAP,
-            blockchain_verified=True,
             proof_hash="0x" + "b" * 64,
-            verification_chain=BlockchainNetwork.ICP,
             feature_importance={
                 "f1": 0.5, "f2": 0.3, "f3": 0.15, "f4": 0.05
-            },
-            processing_time_ms=500,
-            cost_cycles=1_000_000
+            }
         )
         
         score = integration_bridge._calculate_quality_score(explanation)
@@ -242,7 +289,6 @@ class TestMasumiZigguratBridge:
         # High confidence + blockchain verified + good feature coverage + fast
         assert score > 0.8
     
-    @pytest.mark.asyncio
     async def test_submit_custom_explanation(self, integration_bridge):
         """Test submitting custom explanations."""
         result = await integration_bridge.submit_custom_explanation(
@@ -256,17 +302,13 @@ class TestMasumiZigguratBridge:
         assert result.explanation.confidence == 0.82
         assert result.quality_score > 0
     
-    @pytest.mark.asyncio
     async def test_performance_metrics(self, integration_bridge):
         """Test agent performance metrics aggregation."""
         # Add some cached explanations
-        integration_bridge._explanation_cache["task-1"] = ZigguratExplanation(
+        integration_bridge._explanation_cache["task-1"] = dataclasses.replace(
+            _BASE_EXPLANATION,
             reasoning="Test",
-            confidence=0.9,
-            method_used=ExplanationMethod.SHAP,
-            blockchain_verified=True,
             proof_hash="0xtest",
-            verification_chain=BlockchainNetwork.ICP,
             processing_time_ms=100,
             cost_cycles=500_000
         )
@@ -282,7 +324,6 @@ class TestMasumiZigguratBridge:
 class TestRegistrySyncService:
     """Test agent registry synchronization."""
     
-    @pytest.mark.asyncio
     async def test_agent_registration(self, mock_masumi_client, mock_ziggurat_client):
         """Test registering agent on both platforms."""
         sync_service = RegistrySyncService(
@@ -304,7 +345,6 @@ class TestRegistrySyncService:
         assert profile.ziggurat_registered is True
         assert "explainable_ai" in profile.capabilities
     
-    @pytest.mark.asyncio
     async def test_profile_synchronization(self, mock_masumi_client, mock_ziggurat_client):
         """Test synchronizing agent profiles."""
         sync_service = RegistrySyncService(
@@ -330,6 +370,11 @@ class TestRegistrySyncService:
 class TestExplainableRewardsSystem:
     """Test the rewards calculation system."""
     
+    @pytest.fixture(scope="class")
+    def rewards_system(self):
+        """Default-configured rewards system shared across the class."""
+        return ExplainableRewardsSystem()
+    
     def test_reward_calculation(self):
         """Test basic reward calculation."""
         rewards_system = ExplainableRewardsSystem(
@@ -352,10 +397,27 @@ class TestExplainableRewardsSystem:
         assert reward.speed_bonus > 0  # Under 1 second
         assert reward.total_amount > reward.base_amount
     
-    def test_quality_evaluation(self):
-        """Test explanation quality evaluation."""
-        rewards_system = ExplainableRewardsSystem()
+    # Tier bounds and multipliers from the reward tiers in
+    # research/MASUMI_ZIGGURAT_INTEGRATION.md
+    @pytest.mark.parametrize("quality,expected_tier,expected_multiplier", [
+        (0.5, "bronze", 1.0),
+        (0.95, "platinum", 3.0),
+    ])
+    def test_reward_tiers(self, rewards_system, quality, expected_tier, expected_multiplier):
+        """Test the tier and multiplier chosen at other quality levels."""
+        reward = rewards_system.calculate_reward(
+            explanation_quality=quality,
+            task_complexity="high",
+            verified_on_chain=True,
+            processing_time_ms=800,
+            agent_reputation=0.7
+        )
         
+        assert reward.tier.value == expected_tier
+        assert reward.quality_multiplier == expected_multiplier
+    
+    def test_quality_evaluation(self, rewards_system):
+        """Test explanation quality evaluation."""
         metrics = rewards_system.evaluate_explanation_quality(
             explanation_text="The model predicts positive outcome because feature_1 is important.",
             feature_importance={"feature_1": 0.8, "feature_2": 0.2},
@@ -371,10 +433,8 @@ class TestExplainableRewardsSystem:
         assert metrics.innovation_score > 0.5  # Has counterfactuals
         assert 0 < metrics.overall_quality <= 1.0
     
-    def test_reward_pool_distribution(self):
+    def test_reward_pool_distribution(self, rewards_system):
         """Test reward pool creation and distribution."""
-        rewards_system = ExplainableRewardsSystem()
-        
         # Create pool
         pool = rewards_system.create_reward_pool(
             task_type="explainable_ai",
@@ -401,19 +461,31 @@ class TestExplainableRewardsSystem:
 class TestUnifiedPaymentService:
     """Test unified payment processing."""
     
-    @pytest.mark.asyncio
-    async def test_ai_service_payment(self):
-        """Test processing AI service payments."""
-        mock_tx_service = AsyncMock()
-        mock_tx_service.process_payment.return_value = {
-            "success": True,
-            "transaction_id": "test-tx-123"
-        }
+    @pytest.fixture(scope="class")
+    def payment_service(self):
+        """Payment service with a mocked transaction processor, shared across the class."""
+        mock_tx_service = AsyncMock(**{
+            "process_payment.return_value": {
+                "success": True,
+                "transaction_id": "test-tx-123"
+            }
+        })
         
-        payment_service = UnifiedPaymentService(
+        return UnifiedPaymentService(
             transaction_service=mock_tx_service
         )
-        
+    
+    @pytest.fixture(autouse=True)
+    def reset_payment_state(self, payment_service):
+        """Drop payments and balances recorded by each test."""
+        yield
+        payment_service._payments.clear()
+        payment_service._user_payments.clear()
+        payment_service._balances.clear()
+        payment_service._pending_settlements.clear()
+    
+    async def test_ai_service_payment(self, payment_service):
+        """Test processing AI service payments."""
         from agent_forge.src.core.billing.models import PaymentMethod
         
         payment = await payment_service.process_ai_service_payment(
@@ -428,13 +500,8 @@ class TestUnifiedPaymentService:
         assert payment.currency == "ICP"
         assert payment.status == "completed"
     
-    @pytest.mark.asyncio
-    async def test_cross_chain_transfer(self):
+    async def test_cross_chain_transfer(self, payment_service):
         """Test cross-chain currency transfers."""
-        payment_service = UnifiedPaymentService(
-            transaction_service=AsyncMock()
-        )
-        
         source, dest = await payment_service.process_cross_chain_transfer(
             from_currency="ICP",
             to_currency="MASUMI",
@@ -447,20 +514,15 @@ class TestUnifiedPaymentService:
         assert dest.currency == "MASUMI"
         assert dest.amount == Decimal("50.0")  # 1 ICP = 50 MASUMI
     
-    @pytest.mark.asyncio
-    async def test_balance_calculation(self):
+    async def test_balance_calculation(self, payment_service):
         """Test balance summary calculation."""
-        payment_service = UnifiedPaymentService(
-            transaction_service=AsyncMock()
-        )
-        
         # Add some test payments
         from agent_forge.src.core.integrations.unified_payment_service import (
             UnifiedPayment, PaymentType
         )
         
         # Credit
-        payment_service._payments["p1"] = UnifiedPayment(
+        payment_service._record_payment(UnifiedPayment(
             payment_id="p1",
             payment_type=PaymentType.TASK_REWARD,
             amount=Decimal("100"),
@@ -472,10 +534,10 @@ class TestUnifiedPaymentService:
             blockchain_network="cardano",
             transaction_hash="tx1",
             status="completed",
-            created_at=datetime.utcnow(),
-            completed_at=datetime.utcnow(),
+            created_at=FROZEN_NOW_NS,
+            completed_at=FROZEN_NOW,
             metadata={}
-        )
+        ))
         
         balances = await payment_service.get_balance_summary("test-user")
         
@@ -485,7 +547,6 @@ class TestUnifiedPaymentService:
 class TestBlockchainVerificationBridge:
     """Test blockchain verification functionality."""
     
-    @pytest.mark.asyncio
     async def test_cross_chain_verification(self):
         """Test verifying across multiple chains."""
         bridge = BlockchainVerificationBridge()
@@ -501,17 +562,20 @@ class TestBlockchainVerificationBridge:
         assert result.verified_chains == 2
         assert result.consensus_achieved is True  # 2/2 > 66%
     
-    @pytest.mark.asyncio
-    async def test_verification_caching(self):
-        """Test verification result caching."""
+    @pytest_asyncio.fixture(scope="class")
+    async def cached_bridge(self):
+        """Caching bridge with one verification already stored."""
         bridge = BlockchainVerificationBridge(enable_caching=True)
-        
-        # First verification
-        result1 = await bridge.verify_ai_explanation(
+        first_result = await bridge.verify_ai_explanation(
             explanation_data={"test": "data"},
             explanation_hash="cache-test",
             chains=[BlockchainNetwork.ICP]
         )
+        return bridge, first_result
+    
+    async def test_verification_caching(self, cached_bridge):
+        """Test verification result caching."""
+        bridge, result1 = cached_bridge
         
         # Second verification (should use cache)
         result2 = await bridge.verify_ai_explanation(
@@ -523,7 +587,6 @@ class TestBlockchainVerificationBridge:
         # Same proof ID means it was cached
         assert result1.primary_proof.proof_id == result2.primary_proof.proof_id
     
-    @pytest.mark.asyncio
     async def test_consensus_verification(self):
         """Test consensus-based verification."""
         bridge = BlockchainVerificationBridge(consensus_threshold=0.5)
@@ -542,114 +605,113 @@ class TestBlockchainVerificationBridge:
 class TestIntegrationConfig:
     """Test configuration management."""
     
-    def test_default_config_creation(self):
+    @pytest.fixture(scope="class")
+    def config_module(self):
+        """Configuration module, imported only when these tests run."""
+        from agent_forge.src.core.integrations import integration_config
+        return integration_config
+    
+    @pytest.fixture(scope="class")
+    def config_manager(self, config_module):
+        return config_module.IntegrationConfigManager()
+    
+    # Default configs are built once per class; tests that change a config
+    # work on a deep copy
+    
+    @pytest.fixture(scope="class")
+    def dev_config(self, config_module, config_manager):
+        return config_manager.create_default_config(config_module.Environment.DEVELOPMENT)
+    
+    @pytest.fixture(scope="class")
+    def prod_config(self, config_module, config_manager):
+        return config_manager.create_default_config(config_module.Environment.PRODUCTION)
+    
+    @pytest.fixture(scope="class")
+    def testing_config(self, config_module, config_manager):
+        return config_manager.create_default_config(config_module.Environment.TEST)
+    
+    def test_default_config_creation(self, config_module, dev_config, prod_config):
         """Test creating default configurations."""
-        from agent_forge.src.core.integrations.integration_config import (
-            IntegrationConfigManager
-        )
-        
-        manager = IntegrationConfigManager()
+        Environment = config_module.Environment
         
         # Development config
-        dev_config = manager.create_default_config(Environment.DEVELOPMENT)
         assert dev_config.environment == Environment.DEVELOPMENT
         assert dev_config.ziggurat.verify_on_blockchain is False
         
         # Production config
-        prod_config = manager.create_default_config(Environment.PRODUCTION)
         assert prod_config.environment == Environment.PRODUCTION
         assert prod_config.ziggurat.verify_on_blockchain is True
         assert prod_config.ziggurat.max_concurrent_requests > dev_config.ziggurat.max_concurrent_requests
     
-    def test_config_validation(self):
+    def test_config_validation(self, config_manager, testing_config):
         """Test configuration validation."""
-        from agent_forge.src.core.integrations.integration_config import (
-            IntegrationConfigManager
-        )
-        
-        manager = IntegrationConfigManager()
-        config = manager.create_default_config(Environment.TEST)
-        
         # Valid config
-        errors = manager.validate_config(config)
+        errors = config_manager.validate_config(testing_config)
         assert len(errors) == 0
         
         # Invalid config
+        config = copy.deepcopy(testing_config)
         config.rewards.quality_threshold = 1.5  # Invalid
         config.verification.consensus_threshold = 0.3  # Too low
         
-        errors = manager.validate_config(config)
+        errors = config_manager.validate_config(config)
         assert len(errors) == 2
 
 
-@pytest.mark.asyncio
-async def test_end_to_end_integration():
+@pytest.mark.slow
+async def test_end_to_end_integration(integration_bridge):
     """Test complete end-to-end integration flow."""
     # This would be a full integration test with real services
     # For now, we'll use mocks to simulate the flow
+    bridge = integration_bridge
+    masumi = bridge.masumi_client
+    ziggurat = bridge.ziggurat_client
     
-    # 1. Initialize bridge
-    bridge = MasumiZigguratBridge(
-        masumi_api_key="test-key",
-        agent_id="e2e-test-agent"
-    )
-    
-    # Mock the clients
-    bridge.masumi_client = AsyncMock()
-    bridge.ziggurat_client = AsyncMock()
-    
-    # Set up mock responses
-    bridge.masumi_client.get_available_tasks.return_value = [{
-        "id": "e2e-task",
-        "type": "explainable_ai",
-        "reward_amount": 100.0,
-        "reward_token": "MASUMI"
-    }]
-    
-    bridge.masumi_client.claim_task.return_value = {"success": True}
-    bridge.masumi_client.submit_task_completion.return_value = {"success": True}
-    
-    explanation = ZigguratExplanation(
+    explanation = dataclasses.replace(
+        _BASE_EXPLANATION,
         reasoning="E2E test explanation",
         confidence=0.95,
-        method_used=ExplanationMethod.SHAP,
-        blockchain_verified=True,
         proof_hash="0xe2etest",
-        verification_chain=BlockchainNetwork.ICP,
         processing_time_ms=1000,
         cost_cycles=2_000_000
     )
     
-    bridge.ziggurat_client.explain_decision.return_value = explanation
-    
-    reward = MasumiTaskReward(
+    reward = dataclasses.replace(
+        _DEFAULT_REWARD,
         task_id="e2e-task",
-        agent_id="e2e-test-agent",
         reward_amount=150.0,  # With bonuses
-        reward_token="MASUMI",
-        completion_time=datetime.utcnow(),
         quality_score=0.95
     )
     
-    bridge.masumi_client.claim_reward.return_value = reward
-    
-    # 2. Discover tasks
-    tasks = await bridge.discover_explainable_tasks()
-    assert len(tasks) > 0
-    
-    # 3. Process task
-    result = await bridge.process_explainable_task(
-        task_id=tasks[0]["id"],
-        task_data={"e2e": "test"}
-    )
+    # 1. Point the shared mocks at this flow, restoring them afterwards
+    saved = (masumi.tasks, masumi.reward, ziggurat.explanation)
+    masumi.tasks = [{
+        "id": "e2e-task",
+        "type": "explainable_ai",
+        "reward_amount": 100.0,
+        "reward_token": "MASUMI"
+    }]
+    masumi.reward = reward
+    ziggurat.explanation = explanation
+    
+    try:
+        # 2. Discover tasks
+        tasks = await bridge.discover_explainable_tasks()
+        assert len(tasks) > 0
+        
+        # 3. Process task
+        result = await bridge.process_explainable_task(
+            task_id=tasks[0]["id"],
+            task_data={"e2e": "test"}
+        )
+    finally:
+        masumi.tasks, masumi.reward, ziggurat.explanation = saved
     
     # 4. Verify results
     assert result.task_id == "e2e-task"
     assert result.explanation.confidence == 0.95
     assert result.quality_score > 0.9
     assert result.reward.reward_amount == 150.0
-    
-    print("✅ End-to-end integration test passed!")
 
 
 if __name__ == "__main__":